@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import os
 import logging
 from utils.app_utils import resolve_path, handle_request_files, parse_form
+from refresh_task import PlaylistRefresh
 
 
 logger = logging.getLogger(__name__)
@@ -161,8 +162,6 @@ def update_playlist(playlist_name):
 
     # If the updated playlist is currently active, trigger a refresh
     if is_active_playlist:
-        from refresh_task import PlaylistRefresh
-
         # Update refresh_info with new playlist name if it changed
         if playlist_name != new_name:
             refresh_info.playlist = new_name
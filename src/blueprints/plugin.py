@@ -120,12 +120,12 @@ def update_plugin_instance(instance_name):
         if refresh_settings_json:
             refresh_settings = json.loads(refresh_settings_json)
 
-        plugin_instance.settings = plugin_settings
-        
-        # Update refresh settings if provided
+        # Update refresh settings first, as invalid settings raise before anything is changed
         if refresh_settings:
             plugin_instance.refresh = refresh_settings
-            
+
+        plugin_instance.settings = plugin_settings
+
         device_config.write_config()
         
         # Check if this plugin instance is currently active and trigger refresh
@@ -135,8 +135,7 @@ def update_plugin_instance(instance_name):
             refresh_info.plugin_instance == instance_name):
             
             refresh_task = current_app.config['REFRESH_TASK']
-            from refresh_task import PlaylistRefresh
-            
+
             # Find the playlist containing this plugin
             for playlist in playlist_manager.playlists:
                 if playlist.find_plugin(plugin_id, instance_name):
@@ -27,11 +27,13 @@ class Config:
 
     def read_config(self):
         """Reads the device config JSON file and returns it as a dictionary."""
-        logger.debug(f"Reading device config from {self.config_file}")
+        logger.debug("Reading device config from %s", self.config_file)
         with open(self.config_file) as f:
             config = json.load(f)
 
-        logger.debug("Loaded config:\n%s", json.dumps(config, indent=3))
+        # avoid serializing the whole config when debug logging is disabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded config:\n%s", json.dumps(config, indent=3))
 
         return config
 
@@ -54,11 +56,13 @@ class Config:
 
     def write_config(self):
         """Updates the cached config from the model objects and writes to the config file."""
-        logger.debug(f"Writing device config to {self.config_file}")
+        logger.debug("Writing device config to %s", self.config_file)
         self.update_value("playlist_config", self.playlist_manager.to_dict())
         self.update_value("refresh_info", self.refresh_info.to_dict())
+        # serialize up front so the file is written in a single call rather than one write per JSON token
+        config_json = json.dumps(self.config, indent=4)
         with open(self.config_file, 'w') as outfile:
-            json.dump(self.config, outfile, indent=4)
+            outfile.write(config_json)
 
     def get_config(self, key=None, default={}):
         """Gets the value of a specific configuration key or returns the entire config if none provided."""
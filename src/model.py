@@ -1,10 +1,60 @@
 import os
 import json
 import logging
+import threading
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+MINUTES_PER_DAY = 24 * 60
+
+# sentinel that never matches a latest_refresh_time value, forcing cached refresh times to be recomputed
+_UNSET = object()
+
+def _hhmm_to_minutes(time_str):
+    """Converts an 'HH:MM' time string to minutes since midnight ('24:00' maps to 1440)."""
+    if time_str == "24:00":
+        return MINUTES_PER_DAY
+    hours, minutes = time_str[0:2], time_str[3:5]
+    if len(time_str) != 5 or time_str[2] != ":" or not (_is_digits(hours) and _is_digits(minutes)):
+        raise ValueError(f"Invalid time format: '{time_str}', expected 'HH:MM'")
+    hours, minutes = int(hours), int(minutes)
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"Time out of range: '{time_str}'")
+    return hours * 60 + minutes
+
+def _is_digits(value):
+    """Returns True if value consists only of ASCII digits."""
+    return value.isascii() and value.isdigit()
+
+def _split_at_midnight(start_min, end_min):
+    """Returns [start_min, end_min) as a list of (start, end) ranges that do not wrap past midnight."""
+    if start_min <= end_min:
+        return [(start_min, end_min)]
+    return [(start_min, MINUTES_PER_DAY), (0, end_min)]
+
+def _calculate_active_playlist(interval_index, cur_min):
+    """Returns the first playlist in a priority-ordered interval index active at the given minute, or None."""
+    for start, end, playlist in interval_index:
+        if start <= cur_min < end:
+            return playlist
+    return None
+
+def _fill_minute_table(table, interval_index, edges, ranges=None):
+    """Fills each span between consecutive edges of the minute table with its active playlist.
+
+    If ranges is given, only spans overlapping one of the (start, end) ranges are filled.
+    """
+    for i, span_start in enumerate(edges):
+        span_end = edges[i + 1] if i + 1 < len(edges) else MINUTES_PER_DAY
+        if ranges is not None and not any(span_start < end and start < span_end for start, end in ranges):
+            continue
+        table[span_start:span_end] = [_calculate_active_playlist(interval_index, span_start)] * (span_end - span_start)
+
+def _minute_of_day(dt):
+    """Returns the minutes since midnight of a datetime, without formatting it as a string."""
+    return dt.hour * 60 + dt.minute
+
 class RefreshInfo:
     """Keeps track of refresh metadata.
 
@@ -16,6 +66,8 @@ class RefreshInfo:
         playlist (str): Playlist name if refresh_type is 'Playlist'.
         plugin_instance (str): Plugin instance name if refresh_type is 'Playlist'.
     """
+    __slots__ = ("refresh_time", "image_hash", "refresh_type", "plugin_id", "playlist", "plugin_instance",
+                 "_cached_refresh_str", "_cached_refresh_dt")
 
     def __init__(self, refresh_type, plugin_id, refresh_time, image_hash, playlist=None, plugin_instance=None):
         """Initialize RefreshInfo instance."""
@@ -25,13 +77,15 @@ class RefreshInfo:
         self.plugin_id = plugin_id
         self.playlist = playlist
         self.plugin_instance = plugin_instance
+        self._cached_refresh_str = None
+        self._cached_refresh_dt = None
 
     def get_refresh_datetime(self):
         """Returns the refresh time as a datetime object or None if not set."""
-        latest_refresh = None
-        if self.refresh_time:
-            latest_refresh = datetime.fromisoformat(self.refresh_time)
-        return latest_refresh
+        if self._cached_refresh_str is not self.refresh_time:
+            self._cached_refresh_dt = datetime.fromisoformat(self.refresh_time) if self.refresh_time else None
+            self._cached_refresh_str = self.refresh_time
+        return self._cached_refresh_dt
 
     def to_dict(self):
         refresh_dict = {
@@ -67,10 +121,74 @@ class PlaylistManager:
     DEFAULT_PLAYLIST_START = "00:00"
     DEFAULT_PLAYLIST_END = "24:00"
 
-    def __init__(self, playlists=[], active_playlist=None):
+    def __init__(self, playlists=None, active_playlist=None):
         """Initialize PlaylistManager with a list of playlists."""
-        self.playlists = playlists
+        self.playlists = [] if playlists is None else playlists
         self.active_playlist = active_playlist
+        self._index_playlists()
+        # guards the minute table, which is read by the refresh thread and updated by web requests
+        self._cache_lock = threading.Lock()
+        self.invalidate_cache()
+
+    def _index_playlists(self):
+        """Rebuilds the name lookup, keeping the first playlist for duplicate names."""
+        self._by_name = {}
+        for playlist in self.playlists:
+            self._by_name.setdefault(playlist.name, playlist)
+
+    def invalidate_cache(self):
+        """Clears all cached playlist lookups so they are rebuilt on next use."""
+        with self._cache_lock:
+            self._minute_table = None
+
+    def on_playlist_added(self, playlist):
+        """Updates cached lookups for the minutes covered by a newly added playlist."""
+        self._update_minutes((playlist._start_min, playlist._end_min))
+
+    def on_playlist_removed(self, playlist):
+        """Updates cached lookups for the minutes previously covered by a removed playlist."""
+        self._update_minutes((playlist._start_min, playlist._end_min))
+
+    def on_playlist_updated(self, playlist, old_start_min, old_end_min):
+        """Updates cached lookups for the minutes covered by a playlist before and after its times changed."""
+        self._update_minutes((old_start_min, old_end_min), (playlist._start_min, playlist._end_min))
+
+    def _update_minutes(self, *bounds):
+        """Recomputes the minute table only for the edge spans overlapping the given (start, end) bounds.
+
+        A playlist only competes for the minutes it covers, so other minutes keep their active playlist.
+        """
+        with self._cache_lock:
+            if self._minute_table is None:
+                return
+            index, edges = self._build_interval_index()
+            ranges = [r for start_min, end_min in bounds for r in _split_at_midnight(start_min, end_min)]
+            table = list(self._minute_table)
+            _fill_minute_table(table, index, edges, ranges)
+            self._minute_table = table
+
+    def _build_interval_index(self):
+        """Returns a list of (start_min, end_min, playlist) entries in priority order, and the sorted minutes
+        at which the active playlist can change.
+
+        Playlists spanning midnight are split into [start, 1440) and [0, end) entries. Entries are ordered by
+        time range and then by position, matching a stable sort on get_priority(), so the first entry covering
+        a minute is the active playlist.
+        """
+        index = []
+        for playlist in sorted(self.playlists, key=lambda p: p.get_priority()):
+            start, end = playlist._start_min, playlist._end_min
+            if start <= end:
+                index.append((start, end, playlist))
+            else:
+                index.append((start, MINUTES_PER_DAY, playlist))
+                index.append((0, end, playlist))
+        edges = {0}
+        for start, end, _ in index:
+            edges.add(start)
+            if end < MINUTES_PER_DAY:
+                edges.add(end)
+        return index, sorted(edges)
 
     def get_playlist_names(self):
         """Returns a list of all playlist names."""
@@ -78,8 +196,10 @@ class PlaylistManager:
 
     def add_default_playlist(self):
         """Add a default playlist to the manager, called when no playlists exist."""
-        return self.playlists.append(
-            Playlist("Default", PlaylistManager.DEFAULT_PLAYLIST_START, PlaylistManager.DEFAULT_PLAYLIST_END, []))
+        playlist = Playlist("Default", PlaylistManager.DEFAULT_PLAYLIST_START, PlaylistManager.DEFAULT_PLAYLIST_END, [])
+        self.playlists.append(playlist)
+        self._by_name.setdefault(playlist.name, playlist)
+        self.on_playlist_added(playlist)
 
     def find_plugin(self, plugin_id, instance):
         """Searches playlists to find a plugin with the given ID and instance."""
@@ -90,23 +210,30 @@ class PlaylistManager:
         return None
 
     def determine_active_playlist(self, current_datetime):
-        """Determine the active playlist based on the current time."""
-        current_time = current_datetime.strftime("%H:%M")  # Get current time in "HH:MM" format
-
-        # get active playlists that have plugins
-        active_playlists = [p for p in self.playlists if p.is_active(current_time)]
-        if not active_playlists:
+        """Determine the active playlist based on the current time. Returns None if current_datetime
+        is not a datetime."""
+        if not isinstance(current_datetime, datetime):
             return None
-
-        # Sort playlists by priority
-        active_playlists.sort(key=lambda p: p.get_priority())
-        playlist = active_playlists[0]
-
-        return playlist
+        # active playlists only change on playlist edits, so resolve every minute of the day once
+        table = self._minute_table
+        if table is None:
+            with self._cache_lock:
+                table = self._minute_table
+                if table is None:
+                    table = self._build_minute_table()
+                    self._minute_table = table
+        return table[_minute_of_day(current_datetime)]
+
+    def _build_minute_table(self):
+        """Returns a new minute table, resolving the active playlist once per span between interval edges."""
+        index, edges = self._build_interval_index()
+        table = [None] * MINUTES_PER_DAY
+        _fill_minute_table(table, index, edges)
+        return table
 
     def get_playlist(self, playlist_name):
         """Returns the playlist with the specified name."""
-        return next((p for p in self.playlists if p.name == playlist_name), None)
+        return self._by_name.get(playlist_name)
 
     def add_plugin_to_playlist(self, playlist_name, plugin_data):
         """Adds a plugin to a playlist by the specified name. Returns true if successfully added,
@@ -125,23 +252,42 @@ class PlaylistManager:
             start_time = PlaylistManager.DEFAULT_PLAYLIST_START
         if not end_time:
             end_time = PlaylistManager.DEFAULT_PLAYLIST_END
-        self.playlists.append(Playlist(name, start_time, end_time))
+        try:
+            _hhmm_to_minutes(start_time)
+            _hhmm_to_minutes(end_time)
+        except ValueError as e:
+            logger.warning(f"Invalid time range for playlist '{name}': {e}")
+            return False
+        playlist = Playlist(name, start_time, end_time)
+        self.playlists.append(playlist)
+        self._by_name.setdefault(name, playlist)
+        self.on_playlist_added(playlist)
         return True
 
     def update_playlist(self, old_name, new_name, start_time, end_time):
         """Updates an existing playlist's name, start time, and end time."""
         playlist = self.get_playlist(old_name)
         if playlist:
+            old_start_min, old_end_min = playlist._start_min, playlist._end_min
+            try:
+                playlist.set_time_range(start_time, end_time)
+            except ValueError as e:
+                logger.warning(f"Invalid time range for playlist '{old_name}': {e}")
+                return False
             playlist.name = new_name
-            playlist.start_time = start_time
-            playlist.end_time = end_time
+            self._index_playlists()
+            self.on_playlist_updated(playlist, old_start_min, old_end_min)
             return True
         logger.warning(f"Playlist '{old_name}' not found.")
         return False
 
     def delete_playlist(self, name):
         """Deletes the playlist with the specified name."""
+        removed = [p for p in self.playlists if p.name == name]
         self.playlists = [p for p in self.playlists if p.name != name]
+        self._by_name.pop(name, None)
+        for playlist in removed:
+            self.on_playlist_removed(playlist)
 
     def to_dict(self):
         return {
@@ -162,7 +308,7 @@ class PlaylistManager:
         if not latest_refresh:
             return True  # No previous refresh, so it's time to refresh
 
-        return (current_time - latest_refresh) >= timedelta(seconds=interval_seconds)
+        return (current_time - latest_refresh).total_seconds() >= interval_seconds
 
 class Playlist:
     """Represents a playlist with a time interval.
@@ -174,24 +320,76 @@ class Playlist:
         plugins (list): A list of PluginInstance objects within the playlist.
         current_plugin_index (int): Index of the currently active plugin in the playlist.
     """
+    __slots__ = ("name", "_start_time", "_end_time", "_start_min", "_end_min", "plugins", "_plugin_index",
+                 "current_plugin_index")
 
     def __init__(self, name, start_time, end_time, plugins=None, current_plugin_index=None):
         self.name = name
-        self.start_time = start_time
-        self.end_time = end_time
-        self.plugins = [PluginInstance.from_dict(p) for p in (plugins or [])]
+        try:
+            self.set_time_range(start_time, end_time)
+        except (TypeError, ValueError) as e:
+            # keep the stored strings so they are saved unchanged, but never activate the playlist
+            logger.warning(f"Playlist '{name}' has an invalid time range and will be inactive: {e}")
+            self._start_time, self._end_time = start_time, end_time
+            self._start_min = self._end_min = 0
+        self.plugins = [p if isinstance(p, PluginInstance) else PluginInstance.from_dict(p) for p in (plugins or [])]
+        self._index_plugins()
         self.current_plugin_index = current_plugin_index
 
+    @property
+    def start_time(self):
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value):
+        self.set_time_range(value, self._end_time)
+
+    @property
+    def end_time(self):
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value):
+        self.set_time_range(self._start_time, value)
+
+    def set_time_range(self, start_time, end_time):
+        """Sets the start and end times, caching them as minutes since midnight. Raises ValueError and leaves
+        the playlist unchanged if either time is invalid."""
+        start_min = _hhmm_to_minutes(start_time)
+        end_min = _hhmm_to_minutes(end_time)
+        self._start_time, self._end_time = start_time, end_time
+        self._start_min, self._end_min = start_min, end_min
+
+    def _index_plugins(self):
+        """Rebuilds the (plugin_id, name) lookup, keeping the first instance for duplicates."""
+        self._plugin_index = {}
+        for plugin in self.plugins:
+            self._plugin_index.setdefault((plugin.plugin_id, plugin.name), plugin)
+
     def is_active(self, current_time):
-        """Check if the playlist is active at the given time."""
-        return self.start_time <= current_time < self.end_time
+        """Check if the playlist is active at the given time in 'HH:MM' format. Invalid times are never active."""
+        try:
+            cur = _hhmm_to_minutes(current_time)
+        except (TypeError, ValueError):
+            return False
+        return cur < MINUTES_PER_DAY and self.is_active_min(cur)
+
+    def is_active_min(self, cur):
+        """Check if the playlist is active at the given minute of the day."""
+        start, end = self._start_min, self._end_min
+        if start <= end:
+            return start <= cur < end
+        # playlist spans midnight, e.g. 22:00 - 06:00
+        return cur >= start or cur < end
 
     def add_plugin(self, plugin_data):
         """Add a new plugin instance to the playlist."""
         if self.find_plugin(plugin_data["plugin_id"], plugin_data["name"]):
             logger.warning(f"Plugin '{plugin_data['plugin_id']}' with instance '{plugin_data['name']}' already exists.")
             return False
-        self.plugins.append(PluginInstance.from_dict(plugin_data))
+        plugin = PluginInstance.from_dict(plugin_data)
+        self.plugins.append(plugin)
+        self._plugin_index[(plugin.plugin_id, plugin.name)] = plugin
         return True
 
     def update_plugin(self, plugin_id, instance_name, updated_data):
@@ -199,6 +397,8 @@ class Playlist:
         plugin = self.find_plugin(plugin_id, instance_name)
         if plugin:
             plugin.update(updated_data)
+            if (plugin.plugin_id, plugin.name) != (plugin_id, instance_name):
+                self._index_plugins()
             return True
         logger.warning(f"Plugin '{plugin_id}' with name '{instance_name}' not found.")
         return False
@@ -207,7 +407,8 @@ class Playlist:
         """Remove a specific plugin instance from the playlist."""
         initial_count = len(self.plugins)
         self.plugins = [p for p in self.plugins if not (p.plugin_id == plugin_id and p.name == name)]
-        
+        self._plugin_index.pop((plugin_id, name), None)
+
         if len(self.plugins) == initial_count:
             logger.warning(f"Plugin '{plugin_id}' with instance '{name}' not found.")
             return False
@@ -215,16 +416,23 @@ class Playlist:
 
     def find_plugin(self, plugin_id, name):
         """Find a plugin instance by its plugin_id and name."""
-        return next((p for p in self.plugins if p.plugin_id == plugin_id and p.name == name), None)
-
-    def get_next_plugin(self):
-        """Returns the next plugin instance in the playlist and update the current_plugin_index."""
-        if self.current_plugin_index is None:
-            self.current_plugin_index = 0
-        else:
-            self.current_plugin_index = (self.current_plugin_index + 1) % len(self.plugins)
-        
-        return self.plugins[self.current_plugin_index]
+        return self._plugin_index.get((plugin_id, name))
+
+    def find_plugin_to_refresh(self, current_dt, global_should_refresh=False):
+        """Returns the first plugin instance after the current one that should be refreshed and makes it the
+        current plugin. Returns None, leaving current_plugin_index unchanged, if no plugin needs refreshing."""
+        num_plugins = len(self.plugins)
+        start = 0 if self.current_plugin_index is None else self.current_plugin_index + 1
+        if start >= num_plugins:
+            start = 0
+
+        for raw_index in range(start, start + num_plugins):
+            index = raw_index - num_plugins if raw_index >= num_plugins else raw_index
+            plugin = self.plugins[index]
+            if global_should_refresh or plugin.should_refresh(current_dt):
+                self.current_plugin_index = index
+                return plugin
+        return None
 
     def get_priority(self):
         """Determine priority of a playlist, based on the time range"""
@@ -232,15 +440,10 @@ class Playlist:
 
     def get_time_range_minutes(self):
         """Calculate the time difference in minutes between start_time and end_time."""
-        start = datetime.strptime(self.start_time, "%H:%M")
-        # Handle '24:00' by converting it to '00:00' of the next day
-        if self.end_time != "24:00":
-            end = datetime.strptime(self.end_time, "%H:%M")
-        else:
-            end = datetime.strptime("00:00", "%H:%M")
-            end += timedelta(days=1)
-
-        return int((end - start).total_seconds() // 60)
+        start, end = self._start_min, self._end_min
+        if end < start:
+            end += MINUTES_PER_DAY
+        return end - start
 
     def to_dict(self):
         return {
@@ -271,18 +474,64 @@ class PluginInstance:
         refresh (dict): Refresh settings, such as interval and scheduled time.
         latest_refresh (str): ISO-formatted string representing the last refresh time.
     """
+    __slots__ = ("plugin_id", "name", "settings", "_refresh", "latest_refresh_time",
+                 "_cached_refresh_str", "_cached_refresh_dt", "_interval_td", "_scheduled_min",
+                 "_next_refresh_at", "_next_scheduled_at", "_image_path")
+    UPDATABLE_FIELDS = ("plugin_id", "name", "settings", "refresh", "latest_refresh_time")
 
     def __init__(self, plugin_id, name, settings, refresh, latest_refresh_time=None):
         self.plugin_id = plugin_id
         self.name = name
         self.settings = settings
-        self.refresh = refresh
         self.latest_refresh_time = latest_refresh_time
+        # settings loaded from disk must not stop startup, so an invalid scheduled time only disables it
+        self._set_refresh(refresh, strict=False)
+        self._image_path = None
+
+    @property
+    def refresh(self):
+        return self._refresh
+
+    @refresh.setter
+    def refresh(self, value):
+        self._set_refresh(value)
+
+    def _set_refresh(self, value, strict=True):
+        """Sets the refresh settings and caches their parsed interval and scheduled time. An invalid interval
+        or scheduled time raises and leaves the instance unchanged, or if strict is False is logged and ignored."""
+        interval = value.get("interval")
+        try:
+            interval_td = timedelta(seconds=interval) if interval else None
+        except (TypeError, ValueError) as e:
+            if strict:
+                raise
+            logger.warning(f"Plugin instance '{self.name}' has an invalid refresh interval, interval refresh disabled: {e}")
+            interval_td = None
+
+        scheduled = value.get("scheduled")
+        try:
+            scheduled_min = _hhmm_to_minutes(scheduled) if scheduled else None
+        except (TypeError, ValueError) as e:
+            if strict:
+                raise
+            logger.warning(f"Plugin instance '{self.name}' has an invalid scheduled time, scheduled refresh disabled: {e}")
+            scheduled_min = None
+
+        self._refresh = value
+        self._interval_td = interval_td
+        self._scheduled_min = scheduled_min
+        # force the next refresh times to be recomputed for the new settings
+        self._cached_refresh_str = _UNSET
 
     def update(self, updated_data):
         """Update attributes of the class with the dictionary values."""
         for key, value in updated_data.items():
+            if key not in PluginInstance.UPDATABLE_FIELDS:
+                logger.warning(f"Ignoring unknown plugin instance attribute '{key}'.")
+                continue
             setattr(self, key, value)
+            if key in ("plugin_id", "name"):
+                self._image_path = None
 
     def should_refresh(self, current_time):
         """Checks whether the plugin should be refreshed based on its refresh settings and the current time."""
@@ -290,46 +539,55 @@ class PluginInstance:
         if not latest_refresh_dt:
             return True
 
-        # Check for interval-based refresh
-        if "interval" in self.refresh:
-            interval = self.refresh.get("interval")
-            if interval and (current_time - latest_refresh_dt) >= timedelta(seconds=interval):
-                return True
+        # Neither interval nor scheduled refresh configured
+        if self._next_refresh_at is None and self._next_scheduled_at is None:
+            return False
 
-        # Check for scheduled refresh (HH:MM format)
-        if "scheduled" in self.refresh:
-            scheduled_time_str = self.refresh.get("scheduled")
-            latest_refresh_str = latest_refresh_dt.strftime("%H:%M")
+        # Check for interval-based refresh
+        if self._next_refresh_at is not None and current_time >= self._next_refresh_at:
+            return True
 
-            # If the latest refresh is before the scheduled time today
-            if latest_refresh_str < scheduled_time_str:
-                return True
-        
-        if "scheduled" in self.refresh:
-            scheduled_time_str = self.refresh.get("scheduled")
-            scheduled_time = datetime.strptime(scheduled_time_str, "%H:%M").time()
-            
-            latest_refresh_date = latest_refresh_dt.date()
-            current_date = current_time.date()
-
-            # Determine if a refresh is needed based on scheduled time and last refresh
-            if (latest_refresh_date < current_date and current_time.time() >= scheduled_time) or \
-            (latest_refresh_date == current_date and latest_refresh_dt.time() < scheduled_time <= current_time.time()):
-                return True
+        # Check for scheduled refresh, due from the first scheduled time after the latest refresh
+        if self._next_scheduled_at is not None and current_time.replace(tzinfo=None) >= self._next_scheduled_at \
+                and _minute_of_day(current_time) >= self._scheduled_min:
+            return True
 
         return False
 
     def get_image_path(self):
         """Formats the image path for this plugin instance."""
-        return f"{self.plugin_id}_{self.name.replace(' ', '_')}.png"
+        if self._image_path is None:
+            self._image_path = f"{self.plugin_id}_{self.name.replace(' ', '_')}.png"
+        return self._image_path
 
     def get_latest_refresh_dt(self):
         """Returns the latest refresh time as a datetime object, or None if not set."""
-        latest_refresh = None
-        if self.latest_refresh_time:
-            latest_refresh = datetime.fromisoformat(self.latest_refresh_time)
-        return latest_refresh
-    
+        # cache keyed on the string object, so reassigning latest_refresh_time invalidates it
+        if self._cached_refresh_str is not self.latest_refresh_time:
+            self._cached_refresh_dt = datetime.fromisoformat(self.latest_refresh_time) if self.latest_refresh_time else None
+            self._cached_refresh_str = self.latest_refresh_time
+            self._compute_next_refresh()
+        return self._cached_refresh_dt
+
+    def _compute_next_refresh(self):
+        """Computes when the interval and scheduled refresh settings next become due after the latest refresh."""
+        latest = self._cached_refresh_dt
+        self._next_refresh_at = None
+        self._next_scheduled_at = None
+        if latest is None:
+            return
+
+        if self._interval_td:
+            self._next_refresh_at = latest + self._interval_td
+
+        if self._scheduled_min is not None:
+            # scheduled times are wall-clock times, so compare without timezone
+            next_scheduled = latest.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None) \
+                + timedelta(minutes=self._scheduled_min)
+            if _minute_of_day(latest) >= self._scheduled_min:
+                next_scheduled += timedelta(days=1)
+            self._next_scheduled_at = next_scheduled
+
     def to_dict(self):
         return {
             "plugin_id": self.plugin_id,
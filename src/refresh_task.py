@@ -191,21 +191,9 @@ class RefreshTask:
         # Check if enough time has passed based on global interval
         global_should_refresh = PlaylistManager.should_refresh(latest_refresh_dt, plugin_cycle_interval, current_dt)
         
-        # Look for a plugin that needs refreshing
-        plugin_to_refresh = None
-        checked_count = 0
-        
-        # Check each plugin in order to find one that needs refreshing
-        while checked_count < len(playlist.plugins):
-            plugin = playlist.get_next_plugin()
-            
-            # Check if this specific plugin should refresh based on its own settings
-            if plugin.should_refresh(current_dt) or global_should_refresh:
-                plugin_to_refresh = plugin
-                break
-                
-            checked_count += 1
-        
+        # Look for the next plugin that needs refreshing based on its own settings
+        plugin_to_refresh = playlist.find_plugin_to_refresh(current_dt, global_should_refresh)
+
         if plugin_to_refresh:
             logger.info(f"Determined next plugin. | active_playlist: {playlist.name} | plugin_instance: {plugin_to_refresh.name}")
             return playlist, plugin_to_refresh